@@ -25,6 +25,20 @@ class Settings(BaseSettings):
         description="Application description",
     )
     version: str = Field(default="0.1.0", description="Application version")
+    host: str = Field(default="0.0.0.0", description="Host the built-in server binds")
+    port: int = Field(
+        default=8500, description="Port the built-in server listens on", ge=1, le=65535
+    )
+    reload: bool = Field(
+        default=True,
+        description="Run the built-in server with auto-reload (development mode)",
+    )
+    workers: int = Field(
+        default=1,
+        description="Worker processes when reload is off. Each worker keeps its own "
+        "cache, rate limits and in-flight dedup, so every budget is per worker.",
+        ge=1,
+    )
 
     # Search Settings
     default_search_results: int = Field(
@@ -42,16 +56,44 @@ class Settings(BaseSettings):
     cache_ttl_seconds: int = Field(
         default=3600, description="Cache TTL in seconds (1 hour default)", ge=60
     )
+    batch_concurrency: int = Field(
+        default=4,
+        description="Maximum searches from one batch request run at the same time",
+        ge=1,
+        le=10,
+    )
+    cache_max_entries: int = Field(
+        default=1024,
+        description="Maximum number of cached searches kept in memory (LRU eviction)",
+        ge=1,
+    )
 
     # Rate Limiting
     rate_limit_requests_per_minute: int = Field(
-        default=100, description="Rate limit for API requests per minute", ge=1
+        default=100,
+        description="Outbound Google API requests per minute, per server process",
+        ge=1,
+    )
+    search_rate_limit_per_minute: int = Field(
+        default=60,
+        description="Inbound search requests per minute allowed for each client",
+        ge=1,
     )
 
     # HTTP Client Settings
     http_timeout: int = Field(
         default=30, description="HTTP request timeout in seconds", ge=1, le=300
     )
+    http_max_connections: int = Field(
+        default=200, description="Maximum connections in the HTTP client pool", ge=1
+    )
+    http_max_keepalive_connections: int = Field(
+        default=50, description="Maximum idle keep-alive connections in the pool", ge=0
+    )
+    http_keepalive_expiry: float = Field(
+        default=60.0, description="Seconds an idle pooled connection is kept", ge=0
+    )
+    http2: bool = Field(default=True, description="Use HTTP/2 for Google API calls")
 
     # MCP Server Settings
     mcp_mount_path: str = Field(
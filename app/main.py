@@ -1,10 +1,30 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi_mcp import FastApiMCP
 
 from .config import settings
+from .middleware.ratelimit import (
+    MCP_CLIENT_HEADER,
+    MCP_TRANSPORT_CLIENT,
+    RateLimitMiddleware,
+    TokenBucket,
+    client_key,
+    rate_limited_response,
+)
 from .schemas.search import (
+    BaseSearchRequest,
+    BaseSearchResponse,
+    BatchSearch,
+    BatchSearchRequest,
+    BatchSearchResponse,
+    BatchSearchResult,
     ImageSearchRequest,
     ImageSearchResponse,
     NewsSearchRequest,
@@ -14,12 +34,47 @@ from .schemas.search import (
     WebSearchResponse,
 )
 from .services.cache import cache_service
-from .services.google import search_service
+from .services.google import GoogleSearchError, GoogleSearchService
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One search service per app, created inside the serving event loop: its
+    # pooled HTTP client and locks belong to that loop. Open the client up
+    # front so connections are reused across requests, and close it cleanly
+    # on shutdown.
+    search_service = GoogleSearchService()
+    app.state.search_service = search_service
+    app.state.http = search_service.http_client
+    sweeper = asyncio.create_task(cache_service.run_expiry_sweeper())
+    try:
+        yield
+    finally:
+        sweeper.cancel()
+        with suppress(asyncio.CancelledError):
+            await sweeper
+        await search_service.aclose()
+
 
 app = FastAPI(
     title=settings.app_name,
     description=settings.app_description,
     version=settings.version,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+# Per-client throttling of search requests; added before CORS so that
+# rejected responses still carry CORS headers.
+search_rate_limiter = TokenBucket(
+    capacity=settings.search_rate_limit_per_minute,
+    refill_rate=settings.search_rate_limit_per_minute / 60,
+)
+app.add_middleware(
+    RateLimitMiddleware,
+    bucket=search_rate_limiter,
+    path_prefix="/search/",
+    mcp_path=settings.mcp_mount_path,
 )
 
 if settings.enable_cors:
@@ -32,6 +87,12 @@ if settings.enable_cors:
     )
 
 
+# Upstream search failures are a bad gateway, not an internal error
+@app.exception_handler(GoogleSearchError)
+async def google_search_error_handler(request: Request, exc: GoogleSearchError):
+    return ORJSONResponse({"error": str(exc), "code": 502}, status_code=502)
+
+
 # Health check
 @app.get("/health", tags=["system"], operation_id="health_check")
 async def health_check():
@@ -63,10 +124,93 @@ async def cache_clear(all: bool = False):
     return {"cleared": removed, "scope": "expired"}
 
 
+SearchFunction = Callable[[GoogleSearchService, Any], Awaitable[BaseSearchResponse]]
+
+# Called with the app's service, see lifespan()
+_SEARCH_FUNCTIONS: Dict[SearchType, SearchFunction] = {
+    SearchType.WEB: GoogleSearchService.search_web,
+    SearchType.IMAGE: GoogleSearchService.search_images,
+    SearchType.NEWS: GoogleSearchService.search_news,
+}
+
+
+def _request_params(req: BaseSearchRequest) -> Dict[str, Any]:
+    """Same output as req.model_dump(), via the model's core serializer directly."""
+    return type(req).__pydantic_serializer__.to_python(req)
+
+
+async def _search_and_cache(
+    service: GoogleSearchService,
+    req: BaseSearchRequest,
+    search_type: SearchType,
+    params: Dict[str, Any],
+    cache_key: str,
+) -> BaseSearchResponse:
+    """Run a search upstream once per cache key and cache the result."""
+    search = _SEARCH_FUNCTIONS[search_type]
+
+    async def compute() -> BaseSearchResponse:
+        resp = await search(service, req)
+        cache_service.set(req.query, search_type, resp, params, cache_key=cache_key)
+        return resp
+
+    return await cache_service.get_or_compute(cache_key, compute)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+async def _cached_search(
+    req: BaseSearchRequest, search_type: SearchType, request: Request
+):
+    """Serve a search from cache, sharing one upstream call per cache key.
+
+    Responses carry an ETag, and a matching If-None-Match gets a bodiless 304.
+    """
+    params = _request_params(req)
+    cache_key = cache_service.generate_cache_key(req.query, search_type, params)
+    cached = cache_service.get_encoded(cache_key)
+    if cached is None:
+        service = request.app.state.search_service
+        resp = await _search_and_cache(service, req, search_type, params, cache_key)
+        cached = cache_service.get_encoded(cache_key)
+        if cached is None:
+            # Already evicted again (tiny cache bound); no body to validate
+            return resp
+
+    body, etag = cached
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+async def _run_batch_search(
+    service: GoogleSearchService, search: BatchSearch
+) -> BatchSearchResult:
+    """Run one batch entry, reporting failures in the result instead of raising."""
+    req = search.request
+    params = _request_params(req)
+    cache_key = cache_service.generate_cache_key(req.query, search.type, params)
+    try:
+        resp = cache_service.get(req.query, search.type, params, cache_key=cache_key)
+        if resp is None:
+            resp = await _search_and_cache(service, req, search.type, params, cache_key)
+    except GoogleSearchError as e:
+        return BatchSearchResult(id=search.id, status=502, error=str(e))
+    except Exception as e:
+        return BatchSearchResult(id=search.id, status=500, error=str(e))
+    return BatchSearchResult(id=search.id, status=200, body=resp)
+
+
 # Search endpoints
 @app.post(
     "/search/web",
-    response_model=WebSearchResponse,
+    responses={200: {"model": WebSearchResponse}},
     tags=["search"],
     operation_id="search_web",
     summary="Search the web using Google Custom Search API",
@@ -81,18 +225,13 @@ async def cache_clear(all: bool = False):
     Use site parameter to restrict to specific domains (e.g., site='reddit.com')
     """,
 )
-async def search_web_endpoint(req: WebSearchRequest):
-    cached = cache_service.get(req.query, SearchType.WEB, req.model_dump())
-    if cached:
-        return cached
-    resp = await search_service.search_web(req)
-    cache_service.set(req.query, SearchType.WEB, resp, req.model_dump())
-    return resp
+async def search_web_endpoint(req: WebSearchRequest, request: Request):
+    return await _cached_search(req, SearchType.WEB, request)
 
 
 @app.post(
     "/search/images",
-    response_model=ImageSearchResponse,
+    responses={200: {"model": ImageSearchResponse}},
     tags=["search"],
     operation_id="search_images",
     summary="Search for images using Google Custom Search API",
@@ -106,18 +245,13 @@ async def search_web_endpoint(req: WebSearchRequest):
     Additional image-specific filters available: image_size, image_type, color
     """,
 )
-async def search_images_endpoint(req: ImageSearchRequest):
-    cached = cache_service.get(req.query, SearchType.IMAGE, req.model_dump())
-    if cached:
-        return cached
-    resp = await search_service.search_images(req)
-    cache_service.set(req.query, SearchType.IMAGE, resp, req.model_dump())
-    return resp
+async def search_images_endpoint(req: ImageSearchRequest, request: Request):
+    return await _cached_search(req, SearchType.IMAGE, request)
 
 
 @app.post(
     "/search/news",
-    response_model=NewsSearchResponse,
+    responses={200: {"model": NewsSearchResponse}},
     tags=["search"],
     operation_id="search_news",
     summary="Search for news articles using Google Custom Search API",
@@ -131,29 +265,80 @@ async def search_images_endpoint(req: ImageSearchRequest):
     News results can be sorted by 'date' or 'relevance' and filtered by time period
     """,
 )
-async def search_news_endpoint(req: NewsSearchRequest):
-    cached = cache_service.get(req.query, SearchType.NEWS, req.model_dump())
-    if cached:
-        return cached
-    resp = await search_service.search_news(req)
-    cache_service.set(req.query, SearchType.NEWS, resp, req.model_dump())
-    return resp
+async def search_news_endpoint(req: NewsSearchRequest, request: Request):
+    return await _cached_search(req, SearchType.NEWS, request)
+
+
+@app.post(
+    "/search/batch",
+    responses={200: {"model": BatchSearchResponse}},
+    tags=["search"],
+    operation_id="search_batch",
+    summary="Run several searches in a single request",
+    description="""Run up to 10 web, image and news searches concurrently.
+
+    Each entry counts as one request against the per-client rate limit.
+
+    Each entry has a caller-chosen id, a type ('web', 'image' or 'news') and
+    the same request body as the matching /search/* endpoint. Results come
+    back in request order with the entry id, a status code and either the
+    search response or an error message, so one failing search does not
+    fail the whole batch.
+    """,
+)
+async def search_batch_endpoint(req: BatchSearchRequest, request: Request):
+    # The middleware charged one token for the request; charge the other entries
+    extra = len(req.searches) - 1
+    key = client_key(request.scope)
+    if extra and not search_rate_limiter.allow(key, cost=extra):
+        return rate_limited_response(search_rate_limiter, key, cost=extra)
+
+    service = request.app.state.search_service
+    semaphore = asyncio.Semaphore(settings.batch_concurrency)
+
+    async def run(search: BatchSearch) -> BatchSearchResult:
+        async with semaphore:
+            return await _run_batch_search(service, search)
+
+    results = await asyncio.gather(*map(run, req.searches))
+    return BatchSearchResponse(results=results)
 
 
 # Mount MCP server (HTTP transport)
 # Let FastAPI MCP auto-discover all endpoints and convert them to MCP tools
+# Tool calls go through an in-process client with its own client address, so
+# the rate limiter charges them to the MCP caller (see client_key()).
 _mcp = FastApiMCP(
     app,
     name=settings.app_name,
     description=settings.app_description,
     describe_all_responses=True,
     describe_full_response_schema=True,
+    http_client=httpx.AsyncClient(
+        transport=httpx.ASGITransport(
+            app=app, raise_app_exceptions=False, client=MCP_TRANSPORT_CLIENT
+        ),
+        base_url="http://apiserver",
+        timeout=10.0,
+    ),
+    headers=["authorization", MCP_CLIENT_HEADER],
 )
-_mcp.mount()
+_mcp.mount(mount_path=settings.mcp_mount_path)
 
 
 def main():
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8500, reload=True)
+    if settings.reload:
+        uvicorn.run("app.main:app", host=settings.host, port=settings.port, reload=True)
+        return
+
+    uvicorn.run(
+        "app.main:app",
+        host=settings.host,
+        port=settings.port,
+        loop="uvloop",
+        http="httptools",
+        workers=settings.workers,
+    )
 
 
 if __name__ == "__main__":
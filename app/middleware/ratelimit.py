@@ -0,0 +1,141 @@
+import math
+import time
+from typing import Dict, Optional, Tuple
+
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Client address reported by the in-process transport fastapi_mcp uses to call
+# the search endpoints for MCP tools. Real connections never carry this host.
+MCP_TRANSPORT_CLIENT = ("mcp-tool-call", 0)
+# Set on requests to the MCP mount to carry the caller's address into the
+# tool calls they trigger; any client-supplied value is replaced.
+MCP_CLIENT_HEADER = "x-mcp-client"
+_MCP_CLIENT_HEADER_BYTES = MCP_CLIENT_HEADER.encode("latin-1")
+
+
+def client_key(scope: Scope) -> str:
+    """Rate-limit key for a request.
+
+    This is the client address the ASGI server reports (behind a reverse
+    proxy, run uvicorn with --forwarded-allow-ips so it is the real client).
+    MCP tool calls are keyed by the address of the MCP client that made them.
+    """
+    client = scope.get("client")
+    if not client:
+        return "unknown"
+    if tuple(client) == MCP_TRANSPORT_CLIENT:
+        for name, value in scope["headers"]:
+            if name == _MCP_CLIENT_HEADER_BYTES:
+                return value.decode("latin-1")
+        return "mcp"
+    return client[0]
+
+
+class TokenBucket:
+    """Per-key token bucket rate limiter."""
+
+    # Prune full buckets once this many keys are tracked; if most survive,
+    # wait for the table to double again so pruning stays amortized O(1)
+    MAX_TRACKED_KEYS = 10_000
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate  # tokens per second
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._prune_at = self.MAX_TRACKED_KEYS
+
+    def _refill(self, key: str, now: float) -> float:
+        """Return the current token count for a key."""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return self.capacity
+        tokens, last_refill = bucket
+        return min(self.capacity, tokens + (now - last_refill) * self.refill_rate)
+
+    def allow(self, key: str, cost: float = 1) -> bool:
+        """Consume ``cost`` tokens for ``key`` if that many are available."""
+        now = time.monotonic()
+        tokens = self._refill(key, now)
+        allowed = tokens >= cost
+        self._buckets[key] = (tokens - cost if allowed else tokens, now)
+
+        if len(self._buckets) > self._prune_at:
+            self._prune(now)
+        return allowed
+
+    def retry_after(self, key: str, cost: float = 1) -> float:
+        """Seconds until ``key`` has ``cost`` tokens available again."""
+        tokens = self._refill(key, time.monotonic())
+        return max(0.0, (cost - tokens) / self.refill_rate)
+
+    def _prune(self, now: float) -> None:
+        """Forget keys whose bucket has refilled completely."""
+        self._buckets = {
+            key: (tokens, last_refill)
+            for key, (tokens, last_refill) in self._buckets.items()
+            if tokens + (now - last_refill) * self.refill_rate < self.capacity
+        }
+        self._prune_at = max(self.MAX_TRACKED_KEYS, 2 * len(self._buckets))
+
+
+def rate_limited_response(bucket: TokenBucket, key: str, cost: float = 1):
+    """429 response telling the client when ``cost`` tokens are available."""
+    retry_after = math.ceil(bucket.retry_after(key, cost))
+    return ORJSONResponse(
+        {"error": "Rate limit exceeded", "code": 429},
+        status_code=429,
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+class RateLimitMiddleware:
+    """ASGI middleware applying a per-client token bucket to matching paths.
+
+    Requests are keyed by :func:`client_key`. Requests to ``mcp_path`` are not
+    charged themselves; they are tagged with the caller's address so the
+    search endpoint calls they trigger are charged to that caller.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        bucket: TokenBucket,
+        path_prefix: str = "/search/",
+        mcp_path: Optional[str] = None,
+    ):
+        self.app = app
+        self.bucket = bucket
+        self.path_prefix = path_prefix
+        self.mcp_path = mcp_path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if self.mcp_path and path.startswith(self.mcp_path):
+            await self.app(self._tag_mcp_client(scope), receive, send)
+            return
+        if not path.startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        key = client_key(scope)
+        if self.bucket.allow(key):
+            await self.app(scope, receive, send)
+            return
+
+        await rate_limited_response(self.bucket, key)(scope, receive, send)
+
+    @staticmethod
+    def _tag_mcp_client(scope: Scope) -> Scope:
+        """Copy of ``scope`` whose MCP client header holds the caller's key."""
+        headers = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name != _MCP_CLIENT_HEADER_BYTES
+        ]
+        headers.append((_MCP_CLIENT_HEADER_BYTES, client_key(scope).encode("latin-1")))
+        return {**scope, "headers": headers}
@@ -1,5 +1,5 @@
-from typing import List, Optional, Dict, Any, Union
-from pydantic import BaseModel, HttpUrl, Field
+from typing import Annotated, List, Literal, Optional, Dict, Any, Union
+from pydantic import BaseModel, Field
 from datetime import datetime
 from enum import Enum
 
@@ -137,7 +137,9 @@ class BaseSearchResult(BaseModel):
     """Base search result model."""
 
     title: str = Field(description="Result title")
-    link: HttpUrl = Field(description="Result URL")
+    # URL fields are plain strings passed through from Google, which avoids
+    # re-parsing every URL whenever a response model is built or validated.
+    link: str = Field(description="Result URL")
     snippet: Optional[str] = Field(
         default=None, description="Result description/snippet"
     )
@@ -147,9 +149,7 @@ class BaseSearchResult(BaseModel):
 class WebSearchResult(BaseSearchResult):
     """Web search result model."""
 
-    cached_url: Optional[HttpUrl] = Field(
-        default=None, description="Cached version URL"
-    )
+    cached_url: Optional[str] = Field(default=None, description="Cached version URL")
     file_format: Optional[str] = Field(
         default=None, description="File format if applicable"
     )
@@ -171,14 +171,12 @@ class ImageSearchResult(BaseSearchResult):
     """Image search result model."""
 
     image: Optional[Dict[str, Any]] = Field(default=None, description="Image metadata")
-    thumbnail_link: Optional[HttpUrl] = Field(default=None, description="Thumbnail URL")
+    thumbnail_link: Optional[str] = Field(default=None, description="Thumbnail URL")
     thumbnail_height: Optional[int] = Field(
         default=None, description="Thumbnail height"
     )
     thumbnail_width: Optional[int] = Field(default=None, description="Thumbnail width")
-    context_link: Optional[HttpUrl] = Field(
-        default=None, description="Context page URL"
-    )
+    context_link: Optional[str] = Field(default=None, description="Context page URL")
 
 
 class NewsSearchResult(BaseSearchResult):
@@ -268,6 +266,65 @@ class NewsSearchResponse(BaseSearchResponse):
     items: List[NewsSearchResult] = Field(default=[], description="News search results")
 
 
+class WebBatchSearch(BaseModel):
+    """Web search entry in a batch request."""
+
+    id: str = Field(description="Caller-chosen ID echoed back in the batch result")
+    type: Literal[SearchType.WEB] = Field(description="Search type")
+    request: WebSearchRequest = Field(description="Web search parameters")
+
+
+class ImageBatchSearch(BaseModel):
+    """Image search entry in a batch request."""
+
+    id: str = Field(description="Caller-chosen ID echoed back in the batch result")
+    type: Literal[SearchType.IMAGE] = Field(description="Search type")
+    request: ImageSearchRequest = Field(description="Image search parameters")
+
+
+class NewsBatchSearch(BaseModel):
+    """News search entry in a batch request."""
+
+    id: str = Field(description="Caller-chosen ID echoed back in the batch result")
+    type: Literal[SearchType.NEWS] = Field(description="Search type")
+    request: NewsSearchRequest = Field(description="News search parameters")
+
+
+BatchSearch = Annotated[
+    Union[WebBatchSearch, ImageBatchSearch, NewsBatchSearch],
+    Field(discriminator="type"),
+]
+
+
+class BatchSearchRequest(BaseModel):
+    """Batch search request model."""
+
+    searches: List[BatchSearch] = Field(
+        description="Searches to run concurrently (maximum 10 per batch)",
+        min_length=1,
+        max_length=10,
+    )
+
+
+class BatchSearchResult(BaseModel):
+    """Outcome of a single search within a batch."""
+
+    id: str = Field(description="ID of the corresponding batch entry")
+    status: int = Field(description="HTTP-style status code for this search")
+    body: Optional[
+        Union[WebSearchResponse, ImageSearchResponse, NewsSearchResponse]
+    ] = Field(default=None, description="Search response when successful")
+    error: Optional[str] = Field(default=None, description="Error message on failure")
+
+
+class BatchSearchResponse(BaseModel):
+    """Batch search response model."""
+
+    results: List[BatchSearchResult] = Field(
+        description="Results in the same order as the requested searches"
+    )
+
+
 class SearchError(BaseModel):
     """Search error model."""
 
@@ -1,44 +1,90 @@
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Any, Optional, List, Tuple
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from datetime import datetime
+import asyncio
 import hashlib
-import json
+import heapq
+import itertools
+import time
 
-from ..schemas.search import CachedSearch, SearchType, BaseSearchResponse
+import orjson
+
+from ..schemas.search import SearchType, BaseSearchResponse
 from ..config import settings
 
 
+def _isoformat(epoch: float) -> str:
+    """Format an epoch timestamp as local-time ISO 8601."""
+    return datetime.fromtimestamp(epoch).isoformat()
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """In-memory cache record with a monotonic expiry deadline."""
+
+    query: str
+    search_type: SearchType
+    results: BaseSearchResponse
+    # JSON body for results, encoded once so cache hits can skip serialization
+    encoded: bytes
+    # Strong HTTP validator derived from the encoded body
+    etag: str
+    expires_at_mono: float
+    size_bytes: int
+
+
 class CacheService:
     """Simple in-memory cache service for search results."""
 
     def __init__(self):
-        self._cache: Dict[str, CachedSearch] = {}
-        self._search_history: List[Dict[str, Any]] = []
+        self._cache: OrderedDict[str, _CacheEntry] = OrderedDict()
+        # Min-heap of (expires_at_mono, cache_key); may hold stale pairs for
+        # keys that were overwritten or evicted, which are skipped on pop.
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # Running total of _CacheEntry.size_bytes for live entries
+        self._size_bytes = 0
+        # Upstream searches currently running, keyed by cache key
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Only the last 1000 searches are kept
+        self._search_history: deque[Dict[str, Any]] = deque(maxlen=1000)
 
-    def _generate_cache_key(
+    def generate_cache_key(
         self, query: str, search_type: SearchType, params: Dict[str, Any] = None
     ) -> str:
         """Generate a unique cache key for the search."""
-        cache_data = {
-            "query": query.lower().strip(),
-            "search_type": search_type.value,
-            "params": sorted((params or {}).items()),
-        }
-        cache_string = json.dumps(cache_data, sort_keys=True)
-        return hashlib.sha256(cache_string.encode()).hexdigest()[:16]
+        key_tuple = (query.lower().strip(), search_type.value) + tuple(
+            sorted((params or {}).items())
+        )
+        return hashlib.blake2b(repr(key_tuple).encode(), digest_size=8).hexdigest()
 
     def get(
-        self, query: str, search_type: SearchType, params: Dict[str, Any] = None
+        self,
+        query: str,
+        search_type: SearchType,
+        params: Dict[str, Any] = None,
+        cache_key: Optional[str] = None,
     ) -> Optional[BaseSearchResponse]:
         """Get cached search results if they exist and are valid."""
-        cache_key = self._generate_cache_key(query, search_type, params)
+        cache_key = cache_key or self.generate_cache_key(query, search_type, params)
+        entry = self._get_entry(cache_key)
+        return entry.results if entry is not None else None
+
+    def get_encoded(self, cache_key: str) -> Optional[Tuple[bytes, str]]:
+        """Get the pre-encoded JSON body and ETag cached for a cache key."""
+        entry = self._get_entry(cache_key)
+        return (entry.encoded, entry.etag) if entry is not None else None
 
-        if cache_key in self._cache:
-            cached_search = self._cache[cache_key]
-            if datetime.now() < cached_search.expires_at:
-                return cached_search.results
+    def _get_entry(self, cache_key: str) -> Optional[_CacheEntry]:
+        """Return a live entry, marking it recently used."""
+        entry = self._cache.get(cache_key)
+        if entry is not None:
+            if time.monotonic() < entry.expires_at_mono:
+                self._cache.move_to_end(cache_key)
+                return entry
             else:
                 # Remove expired entry
-                del self._cache[cache_key]
+                self._remove(cache_key)
 
         return None
 
@@ -49,84 +95,137 @@ class CacheService:
         results: BaseSearchResponse,
         params: Dict[str, Any] = None,
         ttl_seconds: int = None,
+        cache_key: Optional[str] = None,
     ) -> str:
-        """Cache search results with expiration."""
-        cache_key = self._generate_cache_key(query, search_type, params)
+        """Cache search results with expiration.
+
+        Pass ``cache_key`` when the caller already generated it for a lookup.
+        """
+        cache_key = cache_key or self.generate_cache_key(query, search_type, params)
         ttl = ttl_seconds or settings.cache_ttl_seconds
 
-        now = datetime.now()
-        cached_search = CachedSearch(
-            id=cache_key,
+        now_mono = time.monotonic()
+        encoded = orjson.dumps(results.model_dump(mode="json"))
+        entry = _CacheEntry(
             query=query,
             search_type=search_type,
             results=results,
-            created_at=now,
-            expires_at=now + timedelta(seconds=ttl),
-            metadata=params,
+            encoded=encoded,
+            etag=f'"{hashlib.blake2b(encoded, digest_size=8).hexdigest()}"',
+            expires_at_mono=now_mono + ttl,
+            size_bytes=len(encoded) + len(query),
         )
+        self._remove(cache_key)
+        self._cache[cache_key] = entry
+        self._size_bytes += entry.size_bytes
+        heapq.heappush(self._expiry_heap, (now_mono + ttl, cache_key))
 
-        self._cache[cache_key] = cached_search
+        # Evict least recently used entries beyond the size bound
+        while len(self._cache) > settings.cache_max_entries:
+            _, evicted = self._cache.popitem(last=False)
+            self._size_bytes -= evicted.size_bytes
+
+        # Drop stale heap pairs once they outnumber live entries
+        if len(self._expiry_heap) > 2 * settings.cache_max_entries:
+            self._expiry_heap = [
+                (entry.expires_at_mono, key) for key, entry in self._cache.items()
+            ]
+            heapq.heapify(self._expiry_heap)
 
         # Add to search history
         self._search_history.append(
             {
                 "query": query,
                 "search_type": search_type.value,
-                "timestamp": now.isoformat(),
+                # Formatted as ISO 8601 only when history is read
+                "timestamp_epoch": time.time(),
                 "cache_key": cache_key,
                 "results_count": len(results.items) if hasattr(results, "items") else 0,
             }
         )
 
-        # Keep only last 1000 history entries
-        if len(self._search_history) > 1000:
-            self._search_history = self._search_history[-1000:]
-
         return cache_key
 
+    async def get_or_compute(
+        self,
+        cache_key: str,
+        compute: Callable[[], Awaitable[BaseSearchResponse]],
+    ) -> BaseSearchResponse:
+        """Run ``compute`` once per cache key while it is in flight.
+
+        Concurrent callers with the same key await the first caller's result
+        instead of issuing their own upstream request. The computation runs in
+        its own task, so cancelling any caller (including the first) leaves it
+        running for the others.
+        """
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(compute())
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda done: self._finish_inflight(cache_key, done))
+        return await asyncio.shield(task)
+
+    def _finish_inflight(self, cache_key: str, task: asyncio.Future) -> None:
+        """Forget a finished computation."""
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+        if not task.cancelled():
+            # Mark retrieved so a failure nobody awaited is not logged
+            task.exception()
+
+    def _remove(self, cache_key: str) -> Optional[_CacheEntry]:
+        """Remove an entry and keep the size counter in sync."""
+        entry = self._cache.pop(cache_key, None)
+        if entry is not None:
+            self._size_bytes -= entry.size_bytes
+        return entry
+
     def delete(self, cache_key: str) -> bool:
         """Delete a specific cached entry."""
-        if cache_key in self._cache:
-            del self._cache[cache_key]
-            return True
-        return False
+        return self._remove(cache_key) is not None
 
     def clear_expired(self) -> int:
         """Remove all expired cache entries and return count removed."""
-        now = datetime.now()
-        expired_keys = [
-            key
-            for key, cached_search in self._cache.items()
-            if now >= cached_search.expires_at
-        ]
+        now = time.monotonic()
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] <= now:
+            expires_at_mono, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip pairs left behind by an overwrite or eviction
+            if entry is not None and entry.expires_at_mono == expires_at_mono:
+                self._remove(key)
+                removed += 1
 
-        for key in expired_keys:
-            del self._cache[key]
+        return removed
 
-        return len(expired_keys)
+    async def run_expiry_sweeper(self, interval_seconds: float = 5.0) -> None:
+        """Periodically remove expired entries until cancelled."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            self.clear_expired()
 
     def clear_all(self) -> int:
         """Clear all cache entries and return count removed."""
         count = len(self._cache)
         self._cache.clear()
+        self._expiry_heap.clear()
+        self._size_bytes = 0
         self._search_history.clear()
         return count
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        now = datetime.now()
+        now = time.monotonic()
         valid_entries = sum(
-            1
-            for cached_search in self._cache.values()
-            if now < cached_search.expires_at
+            1 for entry in self._cache.values() if now < entry.expires_at_mono
         )
         expired_entries = len(self._cache) - valid_entries
 
         # Calculate cache hit rate from recent history
+        cutoff = time.time() - 3600
         recent_history = [
-            h
-            for h in self._search_history
-            if datetime.fromisoformat(h["timestamp"]) > now - timedelta(hours=1)
+            h for h in self._search_history if h["timestamp_epoch"] > cutoff
         ]
 
         return {
@@ -135,45 +234,30 @@ class CacheService:
             "expired_entries": expired_entries,
             "total_history_entries": len(self._search_history),
             "recent_searches_1h": len(recent_history),
-            "cache_size_bytes": self._estimate_cache_size(),
+            "cache_size_bytes": self._size_bytes,
         }
 
-    def _estimate_cache_size(self) -> int:
-        """Rough estimation of cache size in bytes."""
-        try:
-            # Rough estimation - not exact but gives an idea
-            return len(
-                json.dumps(
-                    {
-                        key: {
-                            "query": cached_search.query,
-                            "search_type": cached_search.search_type.value,
-                            "results_count": len(cached_search.results.items)
-                            if hasattr(cached_search.results, "items")
-                            else 0,
-                        }
-                        for key, cached_search in self._cache.items()
-                    }
-                )
-            )
-        except Exception:
-            return 0
-
     def get_recent_queries(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent search queries."""
-        return sorted(
-            self._search_history[-limit:], key=lambda x: x["timestamp"], reverse=True
-        )
+        # History is appended in time order, so newest entries are at the end
+        return [
+            {
+                "query": h["query"],
+                "search_type": h["search_type"],
+                "timestamp": _isoformat(h["timestamp_epoch"]),
+                "cache_key": h["cache_key"],
+                "results_count": h["results_count"],
+            }
+            for h in itertools.islice(reversed(self._search_history), limit)
+        ]
 
     def get_popular_queries(
         self, limit: int = 20, hours: int = 24
     ) -> List[Dict[str, Any]]:
         """Get most popular queries within the specified time period."""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        cutoff = time.time() - hours * 3600
         recent_searches = [
-            h
-            for h in self._search_history
-            if datetime.fromisoformat(h["timestamp"]) > cutoff_time
+            h for h in self._search_history if h["timestamp_epoch"] > cutoff
         ]
 
         # Count query frequency
@@ -183,20 +267,23 @@ class CacheService:
             if query in query_counts:
                 query_counts[query]["count"] += 1
                 query_counts[query]["last_searched"] = max(
-                    query_counts[query]["last_searched"], search["timestamp"]
+                    query_counts[query]["last_searched"], search["timestamp_epoch"]
                 )
             else:
                 query_counts[query] = {
                     "query": search["query"],
                     "count": 1,
                     "search_type": search["search_type"],
-                    "last_searched": search["timestamp"],
+                    "last_searched": search["timestamp_epoch"],
                 }
 
         # Sort by count and return top queries
         popular = sorted(query_counts.values(), key=lambda x: x["count"], reverse=True)
 
-        return popular[:limit]
+        popular = popular[:limit]
+        for entry in popular:
+            entry["last_searched"] = _isoformat(entry["last_searched"])
+        return popular
 
 
 # Global cache service instance
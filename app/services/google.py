@@ -1,9 +1,22 @@
 import asyncio
+import functools
 import hashlib
-from typing import Dict, List, Any, Union
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict, deque
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+from datetime import datetime
 import httpx
-import json
+import orjson
 
 from ..config import settings
 from ..schemas.search import (
@@ -18,199 +31,323 @@ from ..schemas.search import (
     NewsSearchResult,
     SearchType,
     SearchInfo,
+    BaseSearchResponse,
 )
 
 
+class GoogleSearchError(Exception):
+    """Raised when a search against the Google Custom Search API fails."""
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client used for Google API calls."""
+    return httpx.AsyncClient(
+        http2=settings.http2,
+        timeout=settings.http_timeout,
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        ),
+    )
+
+
+# Type-specific search parameters, added in place to the common params
+
+
+# Memoized: clients tend to repeat the same operators with different queries
+@functools.lru_cache(maxsize=256)
+def _web_query_suffix(
+    site: Optional[str],
+    file_type: Optional[str],
+    exact_terms: Optional[str],
+    exclude_terms: Optional[str],
+) -> str:
+    """Build the operators appended to a web search query."""
+    parts = []
+    if site:
+        parts.append(f" site:{site}")
+    if file_type:
+        parts.append(f" filetype:{file_type}")
+    if exact_terms:
+        parts.append(f' "{exact_terms}"')
+    if exclude_terms:
+        parts.append(f" -{exclude_terms}")
+    return "".join(parts)
+
+
+def _augment_web(request: WebSearchRequest, params: Dict[str, str]) -> None:
+    """Add web query operators and date restriction."""
+    suffix = _web_query_suffix(
+        request.site, request.file_type, request.exact_terms, request.exclude_terms
+    )
+    if suffix:
+        params["q"] = request.query + suffix
+    if request.time_filter:
+        params["dateRestrict"] = request.time_filter.value
+
+
+def _augment_image(request: ImageSearchRequest, params: Dict[str, str]) -> None:
+    """Add image search filters."""
+    params["searchType"] = "image"
+    if request.image_size:
+        params["imgSize"] = request.image_size.value
+    if request.image_type:
+        params["imgType"] = request.image_type.value
+    if request.color:
+        params["imgColorType"] = request.color
+    if request.usage_rights:
+        params["rights"] = request.usage_rights
+
+
+def _augment_news(request: NewsSearchRequest, params: Dict[str, str]) -> None:
+    """Add news search mode, sorting and time filter."""
+    params["tbm"] = "nws"  # News search
+    if request.sort_by == "date":
+        params["sort"] = "date"
+    if request.time_filter:
+        params["tbs"] = f"qdr:{request.time_filter.value}"
+
+
+# Keyed by request class; subclasses resolve through _augmenter_for()
+_AUGMENTERS: Dict[type, Callable[[Any, Dict[str, str]], None]] = {
+    WebSearchRequest: _augment_web,
+    ImageSearchRequest: _augment_image,
+    NewsSearchRequest: _augment_news,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _augmenter_for(
+    request_cls: type,
+) -> Optional[Callable[[Any, Dict[str, str]], None]]:
+    """Find the augmenter for a request class or its nearest registered base."""
+    for cls in request_cls.__mro__:
+        augment = _AUGMENTERS.get(cls)
+        if augment is not None:
+            return augment
+    # Requests with no type-specific options use the common params only
+    return None
+
+
+# Validate dicts with the models' core validators directly; same checks as
+# Model(**fields) without the keyword packing of BaseModel.__init__.
+_validate_web = WebSearchResult.__pydantic_validator__.validate_python
+_validate_image = ImageSearchResult.__pydantic_validator__.validate_python
+_validate_news = NewsSearchResult.__pydantic_validator__.validate_python
+
+
+# Per-item result builders. Each returns None for an item that fails to
+# parse so one malformed result does not drop the whole response.
+
+
+def _build_web(item: Dict[str, Any]) -> Optional[WebSearchResult]:
+    """Build a web result from a Google API item."""
+    try:
+        return _validate_web(
+            {
+                "title": item.get("title", ""),
+                "link": item.get("link", ""),
+                "snippet": item.get("snippet"),
+                "display_link": item.get("displayLink"),
+                "cached_url": item.get("cacheId"),
+                "file_format": item.get("fileFormat"),
+                "formatted_url": item.get("formattedUrl"),
+                "html_formatted_url": item.get("htmlFormattedUrl"),
+                "html_snippet": item.get("htmlSnippet"),
+                "html_title": item.get("htmlTitle"),
+                "mime_type": item.get("mime"),
+                "page_map": item.get("pagemap"),
+            }
+        )
+    except Exception:
+        return None
+
+
+def _build_image(item: Dict[str, Any]) -> Optional[ImageSearchResult]:
+    """Build an image result from a Google API item."""
+    try:
+        img = item.get("image")
+        return _validate_image(
+            {
+                "title": item.get("title", ""),
+                "link": item.get("link", ""),
+                "snippet": item.get("snippet"),
+                "display_link": item.get("displayLink"),
+                "image": img,
+                "thumbnail_link": img.get("thumbnailLink") if img else None,
+                "thumbnail_height": img.get("thumbnailHeight") if img else None,
+                "thumbnail_width": img.get("thumbnailWidth") if img else None,
+                "context_link": img.get("contextLink") if img else None,
+            }
+        )
+    except Exception:
+        return None
+
+
+def _build_news(item: Dict[str, Any]) -> Optional[NewsSearchResult]:
+    """Build a news result from a Google API item."""
+    try:
+        # Try to extract published date from pagemap or other sources
+        published_date = None
+        pm = item.get("pagemap") or {}
+        na = (pm.get("newsarticle") or [{}])[0]
+        date_str = na.get("datepublished")
+        if date_str:
+            try:
+                # Python 3.11+ parses a trailing "Z" as UTC itself
+                published_date = datetime.fromisoformat(date_str)
+            except Exception:
+                pass
+
+        return _validate_news(
+            {
+                "title": item.get("title", ""),
+                "link": item.get("link", ""),
+                "snippet": item.get("snippet"),
+                "display_link": item.get("displayLink"),
+                "published_date": published_date,
+                "source": item.get("displayLink"),
+                "author": na.get("author"),
+            }
+        )
+    except Exception:
+        return None
+
+
 class GoogleSearchService:
     """Google Custom Search API service with caching and rate limiting."""
 
     BASE_URL = "https://www.googleapis.com/customsearch/v1"
 
-    def __init__(self):
-        self.http_client = httpx.AsyncClient(
-            timeout=settings.http_timeout,
-            limits=httpx.Limits(max_keepalive_connections=10, max_connections=100),
-        )
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._request_timestamps: List[datetime] = []
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        self._http_client = http_client
+        self._cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        # Monotonic times of requests made within the last minute
+        self._request_timestamps: Deque[float] = deque()
+        # Serializes the check-and-append in _rate_limit_check
+        self._rate_limit_lock = asyncio.Lock()
+        # Result parser and response model for each supported search type
+        self._parsers: Dict[SearchType, Tuple[Callable, Type[BaseSearchResponse]]] = {
+            SearchType.WEB: (self._parse_web_results, WebSearchResponse),
+            SearchType.IMAGE: (self._parse_image_results, ImageSearchResponse),
+            SearchType.NEWS: (self._parse_news_results, NewsSearchResponse),
+        }
+        # Request-independent parameters, read from settings once
+        self._base_params = {
+            "key": settings.google_api_key,
+            "cx": settings.google_cse_id,
+        }
+        self._default_num = str(settings.default_search_results)
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared pooled client, created on first use."""
+        if self._http_client is None:
+            self._http_client = create_http_client()
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and its pooled connections."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.http_client.aclose()
+        await self.aclose()
 
     def _generate_cache_key(
         self, search_type: SearchType, params: Dict[str, Any]
     ) -> str:
         """Generate a unique cache key for the search request."""
-        cache_data = {
-            "search_type": search_type.value,
-            "params": sorted(params.items()),
-        }
-        cache_string = json.dumps(cache_data, sort_keys=True)
-        return hashlib.md5(cache_string.encode()).hexdigest()
+        h = hashlib.blake2b(search_type.value.encode(), digest_size=16)
+        for key in sorted(params):
+            h.update(b"\x00")
+            h.update(key.encode())
+            h.update(b"=")
+            h.update(str(params[key]).encode())
+        return h.hexdigest()
 
     def _is_cached_valid(self, cache_entry: Dict[str, Any]) -> bool:
         """Check if cached entry is still valid."""
-        if not cache_entry:
-            return False
-        expires_at = datetime.fromisoformat(cache_entry["expires_at"])
-        return datetime.now() < expires_at
+        return bool(cache_entry) and cache_entry["expires_at"] > time.monotonic()
+
+    def _store_cached(self, cache_key: str, response: BaseSearchResponse) -> None:
+        """Cache a response, evicting least recently used entries."""
+        self._cache[cache_key] = {
+            "response": response,
+            "expires_at": time.monotonic() + settings.cache_ttl_seconds,
+        }
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > settings.cache_max_entries:
+            self._cache.popitem(last=False)
+
+    def _evict_one_expired(self) -> None:
+        """Drop the least recently used entry if it has expired.
+
+        Called on cache misses so expired entries are cleaned up gradually
+        without scanning the whole cache.
+        """
+        if self._cache:
+            cache_key, entry = next(iter(self._cache.items()))
+            if entry["expires_at"] <= time.monotonic():
+                del self._cache[cache_key]
 
     async def _rate_limit_check(self) -> None:
         """Enforce rate limiting."""
-        now = datetime.now()
-        # Remove timestamps older than 1 minute
-        self._request_timestamps = [
-            ts for ts in self._request_timestamps if now - ts < timedelta(minutes=1)
-        ]
+        async with self._rate_limit_lock:
+            now = time.monotonic()
+            timestamps = self._request_timestamps
+            # Remove timestamps older than 1 minute
+            cutoff = now - 60.0
+            while timestamps and timestamps[0] <= cutoff:
+                timestamps.popleft()
 
-        if len(self._request_timestamps) >= settings.rate_limit_requests_per_minute:
-            sleep_time = 60 - (now - self._request_timestamps[0]).seconds
-            await asyncio.sleep(sleep_time)
+            if len(timestamps) >= settings.rate_limit_requests_per_minute:
+                await asyncio.sleep(60.0 - (now - timestamps[0]))
 
-        self._request_timestamps.append(now)
+            timestamps.append(time.monotonic())
 
     def _build_search_params(
         self, request: Union[WebSearchRequest, ImageSearchRequest, NewsSearchRequest]
     ) -> Dict[str, str]:
         """Build search parameters from request."""
+        # Only non-None values are inserted, so the dict is returned as built
         params = {
-            "key": settings.google_api_key,
-            "cx": settings.google_cse_id,
-            "q": request.query,
-            "num": str(request.num_results or settings.default_search_results),
+            **self._base_params,
+            "num": (
+                str(request.num_results) if request.num_results else self._default_num
+            ),
             "start": str(request.start_index or 1),
             "safe": request.safe_search.value if request.safe_search else "medium",
-            "lr": f"lang_{request.language}" if request.language else "lang_en",
+            "lr": "lang_" + (request.language or "en"),
             "gl": request.country or "us",
+            "q": request.query,
         }
 
-        if isinstance(request, WebSearchRequest):
-            if request.site:
-                params["q"] += f" site:{request.site}"
-            if request.file_type:
-                params["q"] += f" filetype:{request.file_type}"
-            if request.exact_terms:
-                params["q"] += f' "{request.exact_terms}"'
-            if request.exclude_terms:
-                params["q"] += f" -{request.exclude_terms}"
-            if request.time_filter:
-                params["dateRestrict"] = request.time_filter.value
-
-        elif isinstance(request, ImageSearchRequest):
-            params["searchType"] = "image"
-            if request.image_size:
-                params["imgSize"] = request.image_size.value
-            if request.image_type:
-                params["imgType"] = request.image_type.value
-            if request.color:
-                params["imgColorType"] = request.color
-            if request.usage_rights:
-                params["rights"] = request.usage_rights
-
-        elif isinstance(request, NewsSearchRequest):
-            params["tbm"] = "nws"  # News search
-            if request.sort_by == "date":
-                params["sort"] = "date"
-            if request.time_filter:
-                params["tbs"] = f"qdr:{request.time_filter.value}"
-
-        return {k: v for k, v in params.items() if v is not None}
+        augment = _augmenter_for(type(request))
+        if augment is not None:
+            augment(request, params)
+        return params
 
     def _parse_web_results(self, items: List[Dict[str, Any]]) -> List[WebSearchResult]:
         """Parse web search results."""
-        results = []
-        for item in items:
-            try:
-                result = WebSearchResult(
-                    title=item.get("title", ""),
-                    link=item.get("link", ""),
-                    snippet=item.get("snippet"),
-                    display_link=item.get("displayLink"),
-                    cached_url=item.get("cacheId"),
-                    file_format=item.get("fileFormat"),
-                    formatted_url=item.get("formattedUrl"),
-                    html_formatted_url=item.get("htmlFormattedUrl"),
-                    html_snippet=item.get("htmlSnippet"),
-                    html_title=item.get("htmlTitle"),
-                    mime_type=item.get("mime"),
-                    page_map=item.get("pagemap"),
-                )
-                results.append(result)
-            except Exception:
-                # Log error but continue processing other results
-                continue
-        return results
+        return [r for r in map(_build_web, items) if r is not None]
 
     def _parse_image_results(
         self, items: List[Dict[str, Any]]
     ) -> List[ImageSearchResult]:
         """Parse image search results."""
-        results = []
-        for item in items:
-            try:
-                result = ImageSearchResult(
-                    title=item.get("title", ""),
-                    link=item.get("link", ""),
-                    snippet=item.get("snippet"),
-                    display_link=item.get("displayLink"),
-                    image=item.get("image"),
-                    thumbnail_link=item.get("image", {}).get("thumbnailLink")
-                    if item.get("image")
-                    else None,
-                    thumbnail_height=item.get("image", {}).get("thumbnailHeight")
-                    if item.get("image")
-                    else None,
-                    thumbnail_width=item.get("image", {}).get("thumbnailWidth")
-                    if item.get("image")
-                    else None,
-                    context_link=item.get("image", {}).get("contextLink")
-                    if item.get("image")
-                    else None,
-                )
-                results.append(result)
-            except Exception:
-                continue
-        return results
+        return [r for r in map(_build_image, items) if r is not None]
 
     def _parse_news_results(
         self, items: List[Dict[str, Any]]
     ) -> List[NewsSearchResult]:
         """Parse news search results."""
-        results = []
-        for item in items:
-            try:
-                # Try to extract published date from pagemap or other sources
-                published_date = None
-                if "pagemap" in item and "newsarticle" in item["pagemap"]:
-                    date_str = item["pagemap"]["newsarticle"][0].get("datepublished")
-                    if date_str:
-                        try:
-                            published_date = datetime.fromisoformat(
-                                date_str.replace("Z", "+00:00")
-                            )
-                        except Exception:
-                            pass
-
-                result = NewsSearchResult(
-                    title=item.get("title", ""),
-                    link=item.get("link", ""),
-                    snippet=item.get("snippet"),
-                    display_link=item.get("displayLink"),
-                    published_date=published_date,
-                    source=item.get("displayLink"),
-                    author=item.get("pagemap", {})
-                    .get("newsarticle", [{}])[0]
-                    .get("author")
-                    if item.get("pagemap")
-                    else None,
-                )
-                results.append(result)
-            except Exception:
-                continue
-        return results
+        return [r for r in map(_build_news, items) if r is not None]
 
     async def _make_search_request(self, params: Dict[str, str]) -> Dict[str, Any]:
         """Make the actual search request to Google API."""
@@ -219,7 +356,7 @@ class GoogleSearchService:
         try:
             response = await self.http_client.get(self.BASE_URL, params=params)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
 
         except httpx.HTTPStatusError as e:
             error_detail = e.response.text if hasattr(e, "response") else str(e)
@@ -228,173 +365,88 @@ class GoogleSearchService:
                 e.response.status_code == 400
                 and "invalid argument" in error_detail.lower()
             ):
-                raise Exception(
+                raise GoogleSearchError(
                     f"Invalid search parameters. Google Custom Search API only supports up to 10 results per request. Error: {error_detail}"
-                )
-            raise Exception(
+                ) from e
+            raise GoogleSearchError(
                 f"Google Search API error: {e.response.status_code} - {error_detail}"
-            )
+            ) from e
         except httpx.RequestError as e:
-            raise Exception(f"Request error: {str(e)}")
-        except json.JSONDecodeError as e:
-            raise Exception(f"Invalid JSON response: {str(e)}")
+            raise GoogleSearchError(f"Request error: {e}") from e
+        except orjson.JSONDecodeError as e:
+            raise GoogleSearchError(f"Invalid JSON response: {e}") from e
+
+    def _build_search_info(self, data: Dict[str, Any]) -> Optional[SearchInfo]:
+        """Build search metadata from the API response, if present."""
+        si = data.get("searchInformation")
+        if si is None:
+            return None
+        return SearchInfo(
+            search_time=si.get("searchTime", 0.0),
+            formatted_search_time=si.get("formattedSearchTime", "0.00"),
+            total_results=si.get("totalResults", "0"),
+            formatted_total_results=si.get("formattedTotalResults", "0"),
+        )
 
-    async def search_web(self, request: WebSearchRequest) -> WebSearchResponse:
-        """Perform web search."""
+    async def _search(
+        self,
+        request: Union[WebSearchRequest, ImageSearchRequest, NewsSearchRequest],
+        search_type: SearchType,
+    ) -> BaseSearchResponse:
+        """Perform a search of the given type with caching.
+
+        Concurrent identical searches are deduplicated one layer up, by
+        CacheService.get_or_compute.
+        """
         params = self._build_search_params(request)
-        cache_key = self._generate_cache_key(SearchType.WEB, params)
+        cache_key = self._generate_cache_key(search_type, params)
 
         # Check cache first
         if cache_key in self._cache and self._is_cached_valid(self._cache[cache_key]):
-            cached_data = self._cache[cache_key]["data"]
-            return WebSearchResponse.model_validate(cached_data)
+            self._cache.move_to_end(cache_key)
+            return self._cache[cache_key]["response"]
+
+        self._evict_one_expired()
+        parser, response_cls = self._parsers[search_type]
 
-        # Make API request
+        data = await self._make_search_request(params)
         try:
-            data = await self._make_search_request(params)
-
-            # Parse results
-            items = data.get("items", [])
-            parsed_results = self._parse_web_results(items)
-
-            # Build response
-            search_info = None
-            if "searchInformation" in data:
-                si = data["searchInformation"]
-                search_info = SearchInfo(
-                    search_time=si.get("searchTime", 0.0),
-                    formatted_search_time=si.get("formattedSearchTime", "0.00"),
-                    total_results=si.get("totalResults", "0"),
-                    formatted_total_results=si.get("formattedTotalResults", "0"),
-                )
-
-            response = WebSearchResponse(
+            response = response_cls(
                 kind=data.get("kind", "customsearch#search"),
                 url=data.get("url"),
                 queries=data.get("queries"),
                 context=data.get("context"),
-                search_information=search_info,
-                items=parsed_results,
+                search_information=self._build_search_info(data),
+                items=parser(data.get("items", [])),
             )
+        except Exception as e:
+            raise GoogleSearchError(
+                f"{search_type.value.capitalize()} search failed: {e}"
+            ) from e
 
-            # Cache the response
-            self._cache[cache_key] = {
-                "data": response.model_dump(),
-                "expires_at": (
-                    datetime.now() + timedelta(seconds=settings.cache_ttl_seconds)
-                ).isoformat(),
-            }
+        # Cache the response
+        self._store_cached(cache_key, response)
 
-            return response
+        return response
 
-        except Exception as e:
-            raise Exception(f"Web search failed: {str(e)}")
+    async def search_web(self, request: WebSearchRequest) -> WebSearchResponse:
+        """Perform web search."""
+        return await self._search(request, SearchType.WEB)
 
     async def search_images(self, request: ImageSearchRequest) -> ImageSearchResponse:
         """Perform image search."""
-        params = self._build_search_params(request)
-        cache_key = self._generate_cache_key(SearchType.IMAGE, params)
-
-        # Check cache first
-        if cache_key in self._cache and self._is_cached_valid(self._cache[cache_key]):
-            cached_data = self._cache[cache_key]["data"]
-            return ImageSearchResponse.model_validate(cached_data)
-
-        try:
-            data = await self._make_search_request(params)
-
-            # Parse results
-            items = data.get("items", [])
-            parsed_results = self._parse_image_results(items)
-
-            # Build response
-            search_info = None
-            if "searchInformation" in data:
-                si = data["searchInformation"]
-                search_info = SearchInfo(
-                    search_time=si.get("searchTime", 0.0),
-                    formatted_search_time=si.get("formattedSearchTime", "0.00"),
-                    total_results=si.get("totalResults", "0"),
-                    formatted_total_results=si.get("formattedTotalResults", "0"),
-                )
-
-            response = ImageSearchResponse(
-                kind=data.get("kind", "customsearch#search"),
-                url=data.get("url"),
-                queries=data.get("queries"),
-                context=data.get("context"),
-                search_information=search_info,
-                items=parsed_results,
-            )
-
-            # Cache the response
-            self._cache[cache_key] = {
-                "data": response.model_dump(),
-                "expires_at": (
-                    datetime.now() + timedelta(seconds=settings.cache_ttl_seconds)
-                ).isoformat(),
-            }
-
-            return response
-
-        except Exception as e:
-            raise Exception(f"Image search failed: {str(e)}")
+        return await self._search(request, SearchType.IMAGE)
 
     async def search_news(self, request: NewsSearchRequest) -> NewsSearchResponse:
         """Perform news search."""
-        params = self._build_search_params(request)
-        cache_key = self._generate_cache_key(SearchType.NEWS, params)
-
-        # Check cache first
-        if cache_key in self._cache and self._is_cached_valid(self._cache[cache_key]):
-            cached_data = self._cache[cache_key]["data"]
-            return NewsSearchResponse.model_validate(cached_data)
-
-        try:
-            data = await self._make_search_request(params)
-
-            # Parse results
-            items = data.get("items", [])
-            parsed_results = self._parse_news_results(items)
-
-            # Build response
-            search_info = None
-            if "searchInformation" in data:
-                si = data["searchInformation"]
-                search_info = SearchInfo(
-                    search_time=si.get("searchTime", 0.0),
-                    formatted_search_time=si.get("formattedSearchTime", "0.00"),
-                    total_results=si.get("totalResults", "0"),
-                    formatted_total_results=si.get("formattedTotalResults", "0"),
-                )
-
-            response = NewsSearchResponse(
-                kind=data.get("kind", "customsearch#search"),
-                url=data.get("url"),
-                queries=data.get("queries"),
-                context=data.get("context"),
-                search_information=search_info,
-                items=parsed_results,
-            )
-
-            # Cache the response
-            self._cache[cache_key] = {
-                "data": response.model_dump(),
-                "expires_at": (
-                    datetime.now() + timedelta(seconds=settings.cache_ttl_seconds)
-                ).isoformat(),
-            }
-
-            return response
-
-        except Exception as e:
-            raise Exception(f"News search failed: {str(e)}")
+        return await self._search(request, SearchType.NEWS)
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         total_entries = len(self._cache)
+        now = time.monotonic()
         valid_entries = sum(
-            1 for entry in self._cache.values() if self._is_cached_valid(entry)
+            1 for entry in self._cache.values() if entry["expires_at"] > now
         )
 
         return {
@@ -407,7 +459,3 @@ class GoogleSearchService:
     def clear_cache(self) -> None:
         """Clear all cached entries."""
         self._cache.clear()
-
-
-# Global service instance
-search_service = GoogleSearchService()
@@ -0,0 +1,6 @@
+import os
+
+# Settings are validated at import time, so provide credentials before any
+# app module is imported. Tests never reach the real Google API.
+os.environ.setdefault("GOOGLE_API_KEY", "test-api-key")
+os.environ.setdefault("GOOGLE_CSE_ID", "test-cse-id")
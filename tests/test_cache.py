@@ -0,0 +1,137 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+import app.services.cache as cache_module
+from app.config import settings
+from app.schemas.search import SearchType, WebSearchResponse
+from app.services.cache import CacheService
+
+
+def _response() -> WebSearchResponse:
+    return WebSearchResponse(kind="customsearch#search", items=[])
+
+
+async def test_get_or_compute_runs_once_for_concurrent_callers():
+    cache = CacheService()
+    calls = 0
+    release = asyncio.Event()
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return _response()
+
+    callers = [
+        asyncio.create_task(cache.get_or_compute("key", compute)) for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*callers)
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert not cache._inflight
+
+
+async def test_cancelling_first_caller_does_not_cancel_waiters():
+    cache = CacheService()
+    release = asyncio.Event()
+
+    async def compute():
+        await release.wait()
+        return _response()
+
+    owner = asyncio.create_task(cache.get_or_compute("key", compute))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.get_or_compute("key", compute))
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+    assert isinstance(await waiter, WebSearchResponse)
+    assert not cache._inflight
+
+
+async def test_get_or_compute_shares_errors_and_forgets_failed_key():
+    cache = CacheService()
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        raise RuntimeError("upstream down")
+
+    results = await asyncio.gather(
+        cache.get_or_compute("key", failing),
+        cache.get_or_compute("key", failing),
+        return_exceptions=True,
+    )
+
+    assert calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert not cache._inflight
+
+    async def succeeding():
+        return _response()
+
+    assert isinstance(await cache.get_or_compute("key", succeeding), WebSearchResponse)
+
+
+def test_recent_queries_keep_the_public_shape():
+    cache = CacheService()
+    cache.set("first", SearchType.WEB, _response())
+    cache.set("second", SearchType.WEB, _response())
+
+    recent = cache.get_recent_queries()
+
+    assert [entry["query"] for entry in recent] == ["second", "first"]
+    assert set(recent[0]) == {
+        "query",
+        "search_type",
+        "timestamp",
+        "cache_key",
+        "results_count",
+    }
+    datetime.fromisoformat(recent[0]["timestamp"])
+
+
+def test_set_evicts_least_recently_used_entry(monkeypatch):
+    monkeypatch.setattr(settings, "cache_max_entries", 2)
+    cache = CacheService()
+    cache.set("a", SearchType.WEB, _response())
+    cache.set("b", SearchType.WEB, _response())
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a", SearchType.WEB) is not None
+
+    cache.set("c", SearchType.WEB, _response())
+
+    assert cache.get("b", SearchType.WEB) is None
+    assert cache.get("a", SearchType.WEB) is not None
+    assert cache.get("c", SearchType.WEB) is not None
+    assert cache.get_stats()["cache_size_bytes"] == sum(
+        entry.size_bytes for entry in cache._cache.values()
+    )
+
+
+def test_expired_entries_are_missed_and_swept(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now)
+    cache = CacheService()
+    cache.set("short", SearchType.WEB, _response(), ttl_seconds=60)
+    cache.set("long", SearchType.WEB, _response(), ttl_seconds=600)
+
+    now += 120
+
+    assert cache.get_stats()["expired_entries"] == 1
+    assert cache.clear_expired() == 1
+    assert cache.get("short", SearchType.WEB) is None
+    assert cache.get("long", SearchType.WEB) is not None
+    assert cache.get_stats()["total_entries"] == 1
@@ -0,0 +1,58 @@
+from app.schemas.search import (
+    BaseSearchRequest,
+    ImageSearchRequest,
+    NewsSearchRequest,
+    WebSearchRequest,
+)
+from app.services.google import GoogleSearchService
+
+
+def test_web_params_append_query_operators():
+    params = GoogleSearchService()._build_search_params(
+        WebSearchRequest(
+            query="python",
+            site="docs.python.org",
+            file_type="pdf",
+            exact_terms="asyncio",
+            exclude_terms="java",
+            time_filter="d",
+        )
+    )
+
+    assert params["q"] == 'python site:docs.python.org filetype:pdf "asyncio" -java'
+    assert params["dateRestrict"] == "d"
+    assert params["lr"] == "lang_en"
+    assert None not in params.values()
+
+
+def test_image_and_news_params():
+    service = GoogleSearchService()
+
+    image = service._build_search_params(
+        ImageSearchRequest(query="cat", image_size="large", color="red")
+    )
+    news = service._build_search_params(
+        NewsSearchRequest(query="election", sort_by="date", time_filter="w")
+    )
+
+    assert image["searchType"] == "image"
+    assert image["imgSize"] == "large"
+    assert image["imgColorType"] == "red"
+    assert news["tbm"] == "nws"
+    assert news["sort"] == "date"
+    assert news["tbs"] == "qdr:w"
+
+
+def test_request_subclasses_use_their_base_augmenter():
+    class SiteSearchRequest(WebSearchRequest):
+        pass
+
+    service = GoogleSearchService()
+    params = service._build_search_params(
+        SiteSearchRequest(query="python", site="docs.python.org")
+    )
+    plain = service._build_search_params(BaseSearchRequest(query="python"))
+
+    assert params["q"] == "python site:docs.python.org"
+    assert plain["q"] == "python"
+    assert "searchType" not in plain and "tbm" not in plain
@@ -0,0 +1,160 @@
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.config import settings
+from app.main import app
+from app.schemas.search import SearchType, WebSearchResponse
+from app.services.cache import cache_service
+from app.services.google import GoogleSearchError, GoogleSearchService
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    cache_service.clear_all()
+    main.search_rate_limiter._buckets.clear()
+    yield
+    cache_service.clear_all()
+    main.search_rate_limiter._buckets.clear()
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+def _batch(*queries):
+    return {
+        "searches": [
+            {"id": str(i), "type": "web", "request": {"query": q}}
+            for i, q in enumerate(queries)
+        ]
+    }
+
+
+def test_lifespan_creates_and_closes_one_service_per_app_run():
+    services = []
+    for _ in range(2):
+        with TestClient(app) as client:
+            assert client.get("/health").status_code == 200
+            service = app.state.search_service
+            assert isinstance(service, GoogleSearchService)
+            assert service._http_client is not None
+            services.append(service)
+        # Shutdown closes the client instead of leaving it to the event loop
+        assert service._http_client is None
+
+    assert services[0] is not services[1]
+
+
+def test_batch_reports_each_failure_without_failing_the_batch(client, monkeypatch):
+    async def web(service, req):
+        return WebSearchResponse(kind="customsearch#search", items=[])
+
+    async def images(service, req):
+        raise GoogleSearchError("Google Search API error: 500 - boom")
+
+    async def news(service, req):
+        raise RuntimeError("parser exploded")
+
+    monkeypatch.setitem(main._SEARCH_FUNCTIONS, SearchType.WEB, web)
+    monkeypatch.setitem(main._SEARCH_FUNCTIONS, SearchType.IMAGE, images)
+    monkeypatch.setitem(main._SEARCH_FUNCTIONS, SearchType.NEWS, news)
+
+    resp = client.post(
+        "/search/batch",
+        json={
+            "searches": [
+                {"id": "w", "type": "web", "request": {"query": "a"}},
+                {"id": "i", "type": "image", "request": {"query": "b"}},
+                {"id": "n", "type": "news", "request": {"query": "c"}},
+            ]
+        },
+    )
+
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert [(r["id"], r["status"]) for r in results] == [
+        ("w", 200),
+        ("i", 502),
+        ("n", 500),
+    ]
+    assert results[0]["body"]["kind"] == "customsearch#search"
+    assert results[1]["error"] == "Google Search API error: 500 - boom"
+    assert results[2]["error"] == "parser exploded"
+
+
+def test_batch_is_charged_one_token_per_entry(client, monkeypatch):
+    async def web(service, req):
+        return WebSearchResponse(kind="customsearch#search", items=[])
+
+    monkeypatch.setitem(main._SEARCH_FUNCTIONS, SearchType.WEB, web)
+    # Leave the test client three tokens: the request and two more entries
+    main.search_rate_limiter._buckets["testclient"] = (3, time.monotonic())
+
+    limited = client.post("/search/batch", json=_batch("a", "b", "c", "d"))
+    assert limited.status_code == 429
+    assert int(limited.headers["Retry-After"]) >= 1
+
+    main.search_rate_limiter._buckets["testclient"] = (3, time.monotonic())
+    allowed = client.post("/search/batch", json=_batch("a", "b", "c"))
+    assert allowed.status_code == 200
+    assert [r["status"] for r in allowed.json()["results"]] == [200, 200, 200]
+
+
+def test_batch_concurrency_is_bounded(client, monkeypatch):
+    running = peak = 0
+
+    async def web(service, req):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return WebSearchResponse(kind="customsearch#search", items=[])
+
+    monkeypatch.setitem(main._SEARCH_FUNCTIONS, SearchType.WEB, web)
+    monkeypatch.setattr(settings, "batch_concurrency", 2)
+
+    resp = client.post("/search/batch", json=_batch(*"abcdefgh"))
+
+    assert resp.status_code == 200
+    assert peak == 2
+
+
+def test_search_serves_cached_body_with_etag_and_304(client, monkeypatch):
+    calls = 0
+
+    async def web(service, req):
+        nonlocal calls
+        calls += 1
+        return WebSearchResponse(kind="customsearch#search", items=[])
+
+    monkeypatch.setitem(main._SEARCH_FUNCTIONS, SearchType.WEB, web)
+
+    first = client.post("/search/web", json={"query": "hello"})
+    etag = first.headers["ETag"]
+    second = client.post("/search/web", json={"query": "hello"})
+    unchanged = client.post(
+        "/search/web", json={"query": "hello"}, headers={"If-None-Match": etag}
+    )
+    weak = client.post(
+        "/search/web",
+        json={"query": "hello"},
+        headers={"If-None-Match": f'"other", W/{etag}'},
+    )
+    stale = client.post(
+        "/search/web", json={"query": "hello"}, headers={"If-None-Match": '"other"'}
+    )
+
+    assert calls == 1
+    assert first.status_code == second.status_code == stale.status_code == 200
+    assert first.content == second.content == stale.content
+    assert first.json()["kind"] == "customsearch#search"
+    assert (unchanged.status_code, unchanged.content) == (304, b"")
+    assert unchanged.headers["ETag"] == etag
+    assert weak.status_code == 304
@@ -0,0 +1,99 @@
+import httpx
+import pytest
+
+from app.middleware.ratelimit import (
+    MCP_CLIENT_HEADER,
+    MCP_TRANSPORT_CLIENT,
+    RateLimitMiddleware,
+    TokenBucket,
+)
+
+
+async def echo_app(scope, receive, send):
+    """Downstream app that reports which MCP client header it received."""
+    headers = dict(scope["headers"])
+    body = headers.get(MCP_CLIENT_HEADER.encode(), b"")
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": body})
+
+
+def make_client(bucket: TokenBucket, client=("10.0.0.1", 5000)) -> httpx.AsyncClient:
+    app = RateLimitMiddleware(echo_app, bucket=bucket, mcp_path="/mcp")
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app, client=client), base_url="http://test"
+    )
+
+
+def test_token_bucket_denies_once_capacity_is_spent():
+    bucket = TokenBucket(capacity=3, refill_rate=1)
+
+    assert [bucket.allow("a") for _ in range(4)] == [True, True, True, False]
+    assert bucket.allow("b")
+    assert 0 < bucket.retry_after("a") <= 1
+    assert not bucket.allow("b", cost=3)
+
+
+def test_prune_is_amortized_while_keys_are_still_refilling(monkeypatch):
+    monkeypatch.setattr(TokenBucket, "MAX_TRACKED_KEYS", 4)
+    bucket = TokenBucket(capacity=1, refill_rate=1e-6)
+    prunes = []
+    prune = bucket._prune
+    monkeypatch.setattr(bucket, "_prune", lambda now: prunes.append(now) or prune(now))
+
+    for i in range(40):
+        bucket.allow(f"10.0.0.{i}")
+
+    # Nothing refills, so every key survives and pruning backs off as it grows
+    assert len(bucket._buckets) == 40
+    assert len(prunes) == 3
+
+
+async def test_exhausted_client_gets_429_with_retry_after():
+    bucket = TokenBucket(capacity=2, refill_rate=2 / 60)
+    async with make_client(bucket) as client:
+        statuses = [(await client.post("/search/web")).status_code for _ in range(3)]
+        limited = await client.post("/search/web")
+        # Paths outside /search/ are never limited
+        health = await client.get("/health")
+
+    assert statuses == [200, 200, 429]
+    assert limited.json() == {"error": "Rate limit exceeded", "code": 429}
+    assert 1 <= int(limited.headers["Retry-After"]) <= 30
+    assert health.status_code == 200
+
+
+async def test_clients_are_limited_separately():
+    bucket = TokenBucket(capacity=1, refill_rate=1 / 60)
+    async with make_client(bucket, ("10.0.0.1", 5000)) as first:
+        assert (await first.post("/search/web")).status_code == 200
+        assert (await first.post("/search/web")).status_code == 429
+    async with make_client(bucket, ("10.0.0.2", 5000)) as second:
+        assert (await second.post("/search/web")).status_code == 200
+
+
+async def test_mcp_requests_are_tagged_with_the_caller_address():
+    bucket = TokenBucket(capacity=1, refill_rate=1 / 60)
+    async with make_client(bucket, ("10.0.0.1", 5000)) as client:
+        # A client-supplied value is replaced, and /mcp itself is not charged
+        for _ in range(3):
+            resp = await client.post(
+                "/mcp/messages/", headers={MCP_CLIENT_HEADER: "10.9.9.9"}
+            )
+            assert resp.status_code == 200
+            assert resp.text == "10.0.0.1"
+
+
+@pytest.mark.parametrize("caller", ["10.0.0.1", "10.0.0.2"])
+async def test_mcp_tool_calls_are_charged_to_their_caller(caller):
+    bucket = TokenBucket(capacity=1, refill_rate=1 / 60)
+    # The caller's direct search spends its only token...
+    async with make_client(bucket, (caller, 5000)) as direct:
+        assert (await direct.post("/search/web")).status_code == 200
+
+    async with make_client(bucket, MCP_TRANSPORT_CLIENT) as tools:
+        # ...so its tool calls are limited, while another caller's are not
+        own = await tools.post("/search/web", headers={MCP_CLIENT_HEADER: caller})
+        other = await tools.post("/search/web", headers={MCP_CLIENT_HEADER: "10.0.0.3"})
+
+    assert own.status_code == 429
+    assert other.status_code == 200